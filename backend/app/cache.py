@@ -0,0 +1,43 @@
+"""In-process caches shared by the API and background tasks."""
+import time
+
+from app.config import settings
+
+# Cached result of GET /logs/sources as (expires_at, sources)
+_sources_cache: tuple[float, list[str]] | None = None
+
+# Cached logs table size check of list_logs as (expires_at, is_large)
+_logs_table_size_cache: tuple[float, bool] | None = None
+
+
+def get_cached_sources() -> list[str] | None:
+    """Return the cached source list, or None if it is missing or expired."""
+    if _sources_cache and _sources_cache[0] > time.monotonic():
+        return _sources_cache[1]
+    return None
+
+
+def set_cached_sources(sources: list[str]):
+    """Cache the source list for SOURCES_CACHE_TTL_SECONDS."""
+    global _sources_cache
+    _sources_cache = (time.monotonic() + settings.SOURCES_CACHE_TTL_SECONDS, sources)
+
+
+def invalidate_sources_cache(sources: set[str]):
+    """Drop the cached source list if any of the given sources is new."""
+    global _sources_cache
+    if _sources_cache and not sources.issubset(_sources_cache[1]):
+        _sources_cache = None
+
+
+def get_cached_logs_table_is_large() -> bool | None:
+    """Return the cached logs table size check, or None if missing or expired."""
+    if _logs_table_size_cache and _logs_table_size_cache[0] > time.monotonic():
+        return _logs_table_size_cache[1]
+    return None
+
+
+def set_cached_logs_table_is_large(is_large: bool):
+    """Cache the logs table size check for TABLE_SIZE_CACHE_TTL_SECONDS."""
+    global _logs_table_size_cache
+    _logs_table_size_cache = (time.monotonic() + settings.TABLE_SIZE_CACHE_TTL_SECONDS, is_large)
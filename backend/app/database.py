@@ -2,14 +2,40 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
+from uuid import uuid4
 
 from app.config import settings
 
-# Create async engine
+# Recurring list and stats queries skip parse/plan through each
+# connection's prepared statement cache
+connect_args = {
+    "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+}
+
+# PgBouncer in transaction mode cannot keep per-connection prepared
+# statements; unique names avoid clashes when backends are shared
+if settings.DB_BEHIND_PGBOUNCER:
+    connect_args = {
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"
+    }
+
+# Create async engine; /stats alone holds four connections per request
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,  # SQL logging (disable in production)
-    future=True
+    echo=settings.SQL_ECHO,
+    future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # Room for every filter/sort combination of list_logs plus the stats
+    # queries, so their compiled SQL is not evicted between requests
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=connect_args
 )
 
 # Session factory
@@ -8,14 +8,17 @@ Features:
 - Aggregated statistics and trend analysis
 - CSV export functionality
 """
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.database import init_db, engine
 from app.routers import logs
+from app.tasks import drain_log_queue, log_flusher, partition_maintainer, stats_refresher
 
 
 @asynccontextmanager
@@ -23,11 +26,22 @@ async def lifespan(app: FastAPI):
     """
     Application lifecycle management.
     
-    On startup: Initialize database tables
-    On shutdown: Clean up resources
+    On startup: Initialize database tables and start background tasks
+    On shutdown: Stop background tasks and clean up resources
     """
     await init_db()
+    tasks = [
+        asyncio.create_task(stats_refresher()),
+        asyncio.create_task(log_flusher()),
+        asyncio.create_task(partition_maintainer())
+    ]
     yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    await drain_log_queue()
     await engine.dispose()
 
 
@@ -52,6 +66,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (log lists, CSV export); streamed bodies are
+# compressed chunk by chunk so the export still streams
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(logs.router, prefix=settings.API_V1_PREFIX)
 
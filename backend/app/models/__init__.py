@@ -1,5 +1,12 @@
 """Database models."""
-from app.models.log import Log, LogSeverity
-
-__all__ = ["Log", "LogSeverity"]
+from app.models.log import Log, LogSeverity, ensure_log_partitions, log_day, log_message_tsv
+from app.models.stats import MvDailyLogStats
 
+__all__ = [
+    "Log",
+    "LogSeverity",
+    "MvDailyLogStats",
+    "ensure_log_partitions",
+    "log_day",
+    "log_message_tsv",
+]
@@ -1,11 +1,17 @@
 """Log model for storing application logs."""
 import enum
-from datetime import datetime
-from sqlalchemy import String, Text, DateTime, Enum, Integer, func
+import logging
+from datetime import UTC, datetime
+from sqlalchemy import DDL, CheckConstraint, String, Text, DateTime, Integer, Index, event, func, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.config import settings
 from app.database import Base
 
+logger = logging.getLogger(__name__)
+
 
 class LogSeverity(str, enum.Enum):
     """Log severity levels following standard conventions."""
@@ -24,20 +30,38 @@ class Log(Base):
     and source information for filtering and analysis.
     """
     __tablename__ = "logs"
+    # Monthly range partitions let time-filtered queries skip old months;
+    # see ensure_log_partitions
+    __table_args__ = (
+        CheckConstraint(
+            "severity IN ({})".format(", ".join(f"'{level.value}'" for level in LogSeverity)),
+            name="ck_logs_severity"
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True
+    )
     
+    # Part of the primary key because PostgreSQL requires the partition
+    # key in every unique constraint of a partitioned table
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.now(),
-        index=True
+        primary_key=True,
+        server_default=func.now()
     )
     
     message: Mapped[str] = mapped_column(Text, nullable=False)
     
-    severity: Mapped[LogSeverity] = mapped_column(
-        Enum(LogSeverity),
-        default=LogSeverity.INFO,
+    # Plain VARCHAR checked against LogSeverity rather than a native enum:
+    # adding a level needs no ALTER TYPE, and reads skip enum conversion.
+    # API schemas coerce the string back to LogSeverity.
+    severity: Mapped[str] = mapped_column(
+        String(10),
+        default=LogSeverity.INFO.value,
         index=True
     )
     
@@ -64,3 +88,95 @@ class Log(Base):
     def __repr__(self) -> str:
         return f"<Log(id={self.id}, severity={self.severity}, source='{self.source}')>"
 
+
+# UTC calendar day of a log. date_trunc on a timestamptz is not immutable,
+# so it is taken on the UTC-normalised value to be usable in an index. The
+# arguments are inlined rather than bound so that GROUP BY and the index
+# match the select list expression exactly.
+log_day = func.date_trunc(
+    text("'day'"),
+    func.timezone(text("'UTC'"), Log.timestamp)
+)
+
+# Full-text search vector over the message, matched with @@ in list queries
+log_message_tsv = func.to_tsvector(text("'english'"), Log.message)
+
+# Also serves plain timestamp filters, so timestamp has no index of its own
+Index("ix_logs_timestamp_id", Log.timestamp, Log.id)
+Index("ix_logs_day", log_day)
+Index("ix_logs_severity_day", Log.severity, log_day)
+# Partial indexes for the common high-severity dashboard filters. They
+# hold only the hot subset of rows, unlike the low-selectivity severity index.
+Index(
+    "ix_logs_errors_ts",
+    Log.timestamp.desc(),
+    postgresql_where=Log.severity.in_([LogSeverity.ERROR.value, LogSeverity.CRITICAL.value])
+)
+Index(
+    "ix_logs_warn_ts",
+    Log.timestamp.desc(),
+    postgresql_where=Log.severity == LogSeverity.WARNING.value
+)
+Index("ix_logs_message_fts", log_message_tsv, postgresql_using="gin")
+Index(
+    "ix_logs_source_trgm",
+    Log.source,
+    postgresql_using="gin",
+    postgresql_ops={"source": "gin_trgm_ops"}
+)
+
+# Trigram operator class used by ix_logs_source_trgm for ILIKE filters
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
+def ensure_log_partitions(connection: Connection):
+    """
+    Create the logs partitions for the current month and the next
+    LOG_PARTITION_MONTHS_AHEAD months, plus a default partition for rows
+    outside them.
+    
+    Runs after create_all and periodically from a background task. A month
+    whose rows already landed in the default partition cannot be attached
+    and is skipped with a warning.
+    
+    Raises RuntimeError if logs exists but is not partitioned, i.e. the
+    database was created before partitioning was introduced.
+    """
+    relkind = connection.execute(text(
+        "SELECT relkind FROM pg_class WHERE oid = to_regclass('logs')"
+    )).scalar()
+    if relkind != "p":
+        raise RuntimeError(
+            "The logs table is not partitioned. It was created by an older "
+            "version of the app; recreate the database (e.g. "
+            "`docker compose down -v`) or migrate logs to a partitioned table."
+        )
+    
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS logs_default PARTITION OF logs DEFAULT"
+    ))
+    
+    today = datetime.now(UTC).date()
+    year, month = today.year, today.month
+    for _ in range(settings.LOG_PARTITION_MONTHS_AHEAD + 1):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        name = f"logs_{year:04d}_{month:02d}"
+        try:
+            with connection.begin_nested():
+                connection.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF logs "
+                    f"FOR VALUES FROM ('{year:04d}-{month:02d}-01 00:00:00+00') "
+                    f"TO ('{next_year:04d}-{next_month:02d}-01 00:00:00+00')"
+                ))
+        except DBAPIError:
+            logger.warning("Could not create partition %s", name, exc_info=True)
+        year, month = next_year, next_month
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_log_partitions(target, connection, **kw):
+    ensure_log_partitions(connection)
@@ -0,0 +1,61 @@
+"""Materialized view model for precomputed log statistics."""
+from datetime import date
+from sqlalchemy import (
+    DDL, Column, Date, Integer, MetaData, String, Table, event, text
+)
+from sqlalchemy.orm import Mapped
+
+from app.database import Base
+
+
+# Views live outside Base.metadata so create_all does not emit them as tables
+view_metadata = MetaData()
+
+mv_daily_log_stats = Table(
+    "mv_daily_log_stats",
+    view_metadata,
+    Column("day", Date, primary_key=True),
+    Column("severity", String(10), primary_key=True),
+    Column("source", String(255), primary_key=True),
+    Column("c", Integer, nullable=False),
+)
+
+
+class MvDailyLogStats(Base):
+    """
+    Daily log counts per severity and source.
+
+    Read-only mapping of the ``mv_daily_log_stats`` materialized view, used
+    by the dashboard statistics so they aggregate a few thousand rows
+    instead of scanning the whole logs table. Refreshed periodically.
+    """
+    __table__ = mv_daily_log_stats
+
+    day: Mapped[date]
+    severity: Mapped[str]
+    source: Mapped[str]
+    c: Mapped[int]
+
+    def __repr__(self) -> str:
+        return f"<MvDailyLogStats(day={self.day}, severity={self.severity}, source='{self.source}', c={self.c})>"
+
+
+# Create the view (and the unique index REFRESH ... CONCURRENTLY requires)
+# right after the logs table is created
+for statement in (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_log_stats AS
+    SELECT date_trunc('day', timezone('UTC', timestamp))::date AS day, severity, source, count(*) AS c
+    FROM logs
+    GROUP BY 1, 2, 3
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_daily_log_stats_key "
+    "ON mv_daily_log_stats (day, severity, source)",
+    "CREATE INDEX IF NOT EXISTS ix_mv_daily_log_stats_day ON mv_daily_log_stats (day)",
+    "CREATE INDEX IF NOT EXISTS ix_mv_daily_log_stats_severity ON mv_daily_log_stats (severity)",
+    "CREATE INDEX IF NOT EXISTS ix_mv_daily_log_stats_source ON mv_daily_log_stats (source)",
+):
+    event.listen(Base.metadata, "after_create", DDL(statement))
+
+
+REFRESH_STATS_VIEW = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_log_stats")
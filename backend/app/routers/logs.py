@@ -1,30 +1,96 @@
 """Log API endpoints for CRUD operations, filtering, and aggregation."""
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from typing import Optional
+import asyncio
 import csv
 import io
+import json
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc, asc, cast, Date
+from sqlalchemy import Select, select, insert, update, delete, func, and_, or_, desc, asc, text, tuple_, lambda_stmt
 from sqlalchemy.sql import extract
 
-from app.database import get_db
-from app.models.log import Log, LogSeverity
+from app.cache import (
+    get_cached_logs_table_is_large,
+    get_cached_sources,
+    invalidate_sources_cache,
+    set_cached_logs_table_is_large,
+    set_cached_sources
+)
+from app.database import get_db, AsyncSessionFactory
+from app.models.log import Log, LogSeverity, log_day, log_message_tsv
+from app.models.stats import MvDailyLogStats
 from app.schemas.log import (
     LogCreate,
     LogUpdate,
     LogResponse,
     LogListResponse,
+    LogListAdapter,
+    LogCursor,
     LogAggregation,
     LogTrend,
     LogStats
 )
 from app.config import settings
+from app.tasks import LOG_QUEUE
 
 router = APIRouter(prefix="/logs", tags=["Logs"])
 
+# Searches shorter than this use ILIKE instead of full-text matching
+MIN_FULL_TEXT_SEARCH_LENGTH = 3
+
+
+# --- Helpers ---
+
+def _utc_date(value: datetime) -> date:
+    """UTC calendar day of a datetime, matching log_day (naive values are taken as UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.date()
+
+
+async def logs_table_is_large(db: AsyncSession) -> bool:
+    """
+    Whether the logs table holds at least ESTIMATED_COUNT_THRESHOLD rows.
+    
+    Sums pg_class.reltuples over the partitions, as the partitioned parent
+    keeps no statistics of its own. Cached for TABLE_SIZE_CACHE_TTL_SECONDS
+    so small tables skip the EXPLAIN in list_logs without an extra query.
+    """
+    is_large = get_cached_logs_table_is_large()
+    if is_large is None:
+        result = await db.execute(text(
+            "SELECT coalesce(sum(greatest(c.reltuples, 0)), 0) "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'logs'::regclass"
+        ))
+        is_large = result.scalar() >= settings.ESTIMATED_COUNT_THRESHOLD
+        set_cached_logs_table_is_large(is_large)
+    return is_large
+
+
+async def estimated_count(db: AsyncSession, stmt: Select) -> int:
+    """
+    Estimate the row count of a query from the PostgreSQL planner.
+    
+    Runs EXPLAIN without executing the query, so the cost is constant
+    regardless of table size. Bound values are passed to the driver as
+    EXPLAIN parameters, never rendered into the SQL text.
+    """
+    compiled = stmt.compile(dialect=db.bind.dialect)
+    params = compiled.construct_params()
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled.string}",
+        tuple(params[name] for name in compiled.positiontup)
+    )
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
 
 # --- CRUD Operations ---
 
@@ -41,19 +107,45 @@ async def create_log(
     - **source**: Source system/application name
     - **timestamp**: Optional custom timestamp (defaults to now)
     """
-    log = Log(
-        message=log_data.message,
-        severity=log_data.severity,
-        source=log_data.source,
-        metadata_json=log_data.metadata_json,
-        timestamp=log_data.timestamp or datetime.utcnow()
+    # RETURNING brings back the server defaults (id, created_at, updated_at)
+    # without a separate refresh SELECT
+    stmt = (
+        insert(Log)
+        .values(
+            message=log_data.message,
+            severity=log_data.severity.value,
+            source=log_data.source,
+            metadata_json=log_data.metadata_json,
+            timestamp=log_data.timestamp or datetime.now(UTC)
+        )
+        .returning(Log)
     )
-    db.add(log)
-    await db.flush()
-    await db.refresh(log)
+    result = await db.execute(stmt)
+    log = result.scalar_one()
+    # Commit before invalidating so /sources cannot re-cache the old list
+    await db.commit()
+    invalidate_sources_cache({log.source})
     return log
 
 
+@router.post("/bulk-async", status_code=status.HTTP_202_ACCEPTED)
+async def create_logs_async(logs: list[LogCreate]):
+    """
+    Queue log entries for asynchronous insertion.
+    
+    Returns as soon as the entries are queued; a background task writes
+    them in batches. Use this for high-volume, fire-and-forget ingestion
+    where the created IDs are not needed.
+    """
+    now = datetime.now(UTC)
+    for log_data in logs:
+        # JSON mode stores severity as its plain string value
+        row = log_data.model_dump(mode="json", exclude={"timestamp"})
+        row["timestamp"] = log_data.timestamp or now
+        await LOG_QUEUE.put(row)
+    return {"queued": len(logs)}
+
+
 @router.get("", response_model=LogListResponse)
 async def list_logs(
     page: int = Query(1, ge=1, description="Page number"),
@@ -65,16 +157,36 @@ async def list_logs(
     search: Optional[str] = Query(None, description="Search in message"),
     sort_by: str = Query("timestamp", description="Sort field"),
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    cursor_ts: Optional[datetime] = Query(None, description="Keyset cursor: timestamp of the last seen log"),
+    cursor_id: Optional[int] = Query(None, description="Keyset cursor: id of the last seen log"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List logs with filtering, sorting, and pagination.
     
     Supports filtering by date range, severity, source, and text search.
+    
+    Page-number paging gets slower the deeper the page, since skipped rows
+    are still scanned. For deep paging pass the `next_cursor` of the
+    previous response as `cursor_ts`/`cursor_id` instead of `page`; each
+    page then costs the same. Cursor paging requires the default
+    newest-first sort, and cursor pages return no `total`/`total_pages`
+    (take them from the first page).
     """
+    use_cursor = cursor_ts is not None or cursor_id is not None
+    if use_cursor and (cursor_ts is None or cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor_ts and cursor_id must be provided together"
+        )
+    if use_cursor and (sort_by != "timestamp" or sort_order.lower() != "desc"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination only supports sort_by=timestamp, sort_order=desc"
+        )
+    
     # Build base query
     query = select(Log)
-    count_query = select(func.count(Log.id))
     
     # Apply filters
     conditions = []
@@ -88,62 +200,180 @@ async def list_logs(
     if source:
         conditions.append(Log.source.ilike(f"%{source}%"))
     if search:
-        conditions.append(Log.message.ilike(f"%{search}%"))
+        if len(search) < MIN_FULL_TEXT_SEARCH_LENGTH:
+            # Too short to form word tokens; fall back to substring match
+            conditions.append(Log.message.ilike(f"%{search}%"))
+        else:
+            conditions.append(
+                log_message_tsv.op("@@")(func.plainto_tsquery(text("'english'"), search))
+            )
     
     if conditions:
         query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
     
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-    
-    # Apply sorting
+    # Cursor pages report no total: the first page already did, and an
+    # exact count would scan every match on each page
+    total = None
+    is_estimated = False
+    if not use_cursor:
+        # Unfiltered or severity-only listings can use the planner's row
+        # estimate once the table is large enough for an exact count to hurt
+        filtered = start_date or end_date or source or search
+        if not filtered and await logs_table_is_large(db):
+            total = await estimated_count(db, query)
+            is_estimated = total >= settings.ESTIMATED_COUNT_THRESHOLD
+        
+        if not is_estimated:
+            # The window count returns the filtered total with every row so a
+            # single round-trip covers both the page and the count
+            query = query.add_columns(func.count().over().label("total"))
+    
+    # Apply sorting, with id as a tie-breaker for a stable order
     sort_column = getattr(Log, sort_by, Log.timestamp)
     if sort_order.lower() == "asc":
-        query = query.order_by(asc(sort_column))
+        query = query.order_by(asc(sort_column), asc(Log.id))
     else:
-        query = query.order_by(desc(sort_column))
+        query = query.order_by(desc(sort_column), desc(Log.id))
     
     # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+    if use_cursor:
+        query = query.where(tuple_(Log.timestamp, Log.id) < tuple_(cursor_ts, cursor_id))
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+    query = query.limit(page_size)
     
     # Execute query
     result = await db.execute(query)
-    logs = result.scalars().all()
+    if is_estimated or use_cursor:
+        logs = result.scalars().all()
+    else:
+        rows = result.all()
+        logs = [row[0] for row in rows]
+        total = rows[0].total if rows else 0
     
     # Calculate total pages
-    total_pages = (total + page_size - 1) // page_size
+    total_pages = None if total is None else (total + page_size - 1) // page_size
+    
+    # A full page in newest-first order may have more rows after it
+    next_cursor = None
+    if len(logs) == page_size and sort_by == "timestamp" and sort_order.lower() == "desc":
+        next_cursor = LogCursor(ts=logs[-1].timestamp, id=logs[-1].id)
     
-    return LogListResponse(
-        items=logs,
+    # The page is validated once here and encoded straight to JSON bytes,
+    # skipping FastAPI's second validation pass over response_model
+    response = LogListResponse.model_construct(
+        items=LogListAdapter.validate_python(logs, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        is_estimated=is_estimated,
+        next_cursor=next_cursor
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/sources", response_model=list[str])
 async def get_sources(db: AsyncSession = Depends(get_db)):
-    """Get list of unique log sources."""
+    """
+    Get list of unique log sources.
+    
+    Served from an in-process cache for SOURCES_CACHE_TTL_SECONDS, since
+    the set of sources changes rarely.
+    """
+    sources = get_cached_sources()
+    if sources is not None:
+        return sources
+    
     result = await db.execute(
-        select(Log.source).distinct().order_by(Log.source)
+        select(Log.source).group_by(Log.source).order_by(Log.source)
+    )
+    sources = [row[0] for row in result.fetchall()]
+    set_cached_sources(sources)
+    return sources
+
+
+async def _stats_total(conditions: list) -> int:
+    """Total log count from the statistics view."""
+    query = select(func.coalesce(func.sum(MvDailyLogStats.c), 0))
+    if conditions:
+        query = query.where(and_(*conditions))
+    async with AsyncSessionFactory() as session:
+        result = await session.execute(query)
+    return int(result.scalar() or 0)
+
+
+async def _stats_severity(conditions: list) -> list[LogAggregation]:
+    """Log counts per severity from the statistics view."""
+    query = (
+        select(MvDailyLogStats.severity, func.sum(MvDailyLogStats.c).label("count"))
+        .group_by(MvDailyLogStats.severity)
+        .order_by(desc("count"))
+    )
+    if conditions:
+        query = query.where(and_(*conditions))
+    async with AsyncSessionFactory() as session:
+        result = await session.execute(query)
+    return [
+        LogAggregation(label=row[0], count=int(row[1]))
+        for row in result.fetchall()
+    ]
+
+
+async def _stats_source(conditions: list) -> list[LogAggregation]:
+    """Top 10 sources by log count from the statistics view."""
+    query = (
+        select(MvDailyLogStats.source, func.sum(MvDailyLogStats.c).label("count"))
+        .group_by(MvDailyLogStats.source)
+        .order_by(desc("count"))
+        .limit(10)
+    )
+    if conditions:
+        query = query.where(and_(*conditions))
+    async with AsyncSessionFactory() as session:
+        result = await session.execute(query)
+    return [
+        LogAggregation(label=row[0], count=int(row[1]))
+        for row in result.fetchall()
+    ]
+
+
+async def _stats_trend(conditions: list) -> list[LogTrend]:
+    """Daily log counts from the statistics view (last 30 days by default)."""
+    query = (
+        select(MvDailyLogStats.day.label("date"), func.sum(MvDailyLogStats.c).label("count"))
+        .group_by(MvDailyLogStats.day)
+        .order_by("date")
     )
-    return [row[0] for row in result.fetchall()]
+    if conditions:
+        query = query.where(and_(*conditions))
+    else:
+        # Default to last 30 days
+        thirty_days_ago = datetime.now(UTC) - timedelta(days=30)
+        query = query.where(MvDailyLogStats.day >= thirty_days_ago.date())
+    async with AsyncSessionFactory() as session:
+        result = await session.execute(query)
+    return [
+        LogTrend(date=str(row[0]), count=int(row[1]))
+        for row in result.fetchall()
+    ]
 
 
 @router.get("/stats", response_model=LogStats)
 async def get_log_stats(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    source: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    source: Optional[str] = Query(None)
 ):
     """
     Get aggregated log statistics.
     
+    Aggregates the mv_daily_log_stats materialized view rather than the
+    raw logs table, so results are day-granular and may lag new logs by
+    up to STATS_REFRESH_INTERVAL_SECONDS. The four aggregations run
+    concurrently, each on its own pooled connection.
+    
     Returns:
     - Total log count
     - Breakdown by severity
@@ -153,69 +383,18 @@ async def get_log_stats(
     # Build conditions
     conditions = []
     if start_date:
-        conditions.append(Log.timestamp >= start_date)
+        conditions.append(MvDailyLogStats.day >= _utc_date(start_date))
     if end_date:
-        conditions.append(Log.timestamp <= end_date)
+        conditions.append(MvDailyLogStats.day <= _utc_date(end_date))
     if source:
-        conditions.append(Log.source == source)
-    
-    # Total count
-    total_query = select(func.count(Log.id))
-    if conditions:
-        total_query = total_query.where(and_(*conditions))
-    total_result = await db.execute(total_query)
-    total_logs = total_result.scalar() or 0
-    
-    # Severity breakdown
-    severity_query = (
-        select(Log.severity, func.count(Log.id).label("count"))
-        .group_by(Log.severity)
-        .order_by(desc("count"))
-    )
-    if conditions:
-        severity_query = severity_query.where(and_(*conditions))
-    severity_result = await db.execute(severity_query)
-    severity_breakdown = [
-        LogAggregation(label=row[0].value, count=row[1])
-        for row in severity_result.fetchall()
-    ]
-    
-    # Source breakdown (top 10)
-    source_query = (
-        select(Log.source, func.count(Log.id).label("count"))
-        .group_by(Log.source)
-        .order_by(desc("count"))
-        .limit(10)
-    )
-    if conditions:
-        source_query = source_query.where(and_(*conditions))
-    source_result = await db.execute(source_query)
-    source_breakdown = [
-        LogAggregation(label=row[0], count=row[1])
-        for row in source_result.fetchall()
-    ]
+        conditions.append(MvDailyLogStats.source == source)
     
-    # Trend data (daily counts for last 30 days or date range)
-    trend_query = (
-        select(
-            cast(Log.timestamp, Date).label("date"),
-            func.count(Log.id).label("count")
-        )
-        .group_by(cast(Log.timestamp, Date))
-        .order_by("date")
+    total_logs, severity_breakdown, source_breakdown, trend_data = await asyncio.gather(
+        _stats_total(conditions),
+        _stats_severity(conditions),
+        _stats_source(conditions),
+        _stats_trend(conditions)
     )
-    if conditions:
-        trend_query = trend_query.where(and_(*conditions))
-    else:
-        # Default to last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        trend_query = trend_query.where(Log.timestamp >= thirty_days_ago)
-    
-    trend_result = await db.execute(trend_query)
-    trend_data = [
-        LogTrend(date=str(row[0]), count=row[1])
-        for row in trend_result.fetchall()
-    ]
     
     return LogStats(
         total_logs=total_logs,
@@ -256,38 +435,38 @@ async def get_log_trend(
     
     if not start_date and not end_date:
         # Default to last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+        thirty_days_ago = datetime.now(UTC) - timedelta(days=30)
         conditions.append(Log.timestamp >= thirty_days_ago)
     
     if group_by_severity:
         query = (
             select(
-                cast(Log.timestamp, Date).label("date"),
+                log_day.label("date"),
                 Log.severity,
                 func.count(Log.id).label("count")
             )
             .where(and_(*conditions) if conditions else True)
-            .group_by(cast(Log.timestamp, Date), Log.severity)
+            .group_by(log_day, Log.severity)
             .order_by("date")
         )
         result = await db.execute(query)
         return [
-            LogTrend(date=str(row[0]), count=row[2], severity=row[1].value)
+            LogTrend(date=str(row[0].date()), count=row[2], severity=row[1])
             for row in result.fetchall()
         ]
     else:
         query = (
             select(
-                cast(Log.timestamp, Date).label("date"),
+                log_day.label("date"),
                 func.count(Log.id).label("count")
             )
             .where(and_(*conditions) if conditions else True)
-            .group_by(cast(Log.timestamp, Date))
+            .group_by(log_day)
             .order_by("date")
         )
         result = await db.execute(query)
         return [
-            LogTrend(date=str(row[0]), count=row[1])
+            LogTrend(date=str(row[0].date()), count=row[1])
             for row in result.fetchall()
         ]
 
@@ -297,13 +476,14 @@ async def export_logs_csv(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     severity: Optional[LogSeverity] = Query(None),
-    source: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    source: Optional[str] = Query(None)
 ):
     """
     Export filtered logs as CSV file.
     
     Bonus feature: Downloads logs matching the filter criteria.
+    Rows are streamed to the client as they are read, so memory use
+    stays constant regardless of the export size.
     """
     # Build query
     query = select(Log)
@@ -321,32 +501,39 @@ async def export_logs_csv(
     if conditions:
         query = query.where(and_(*conditions))
     
-    query = query.order_by(desc(Log.timestamp))
-    
-    result = await db.execute(query)
-    logs = result.scalars().all()
-    
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["ID", "Timestamp", "Severity", "Source", "Message"])
-    
-    for log in logs:
-        writer.writerow([
-            log.id,
-            log.timestamp.isoformat(),
-            log.severity.value,
-            log.source,
-            log.message
-        ])
-    
-    output.seek(0)
+    query = query.order_by(desc(Log.timestamp)).execution_options(yield_per=1000)
+    
+    async def row_iter():
+        """
+        Stream CSV rows from a server-side cursor.
+        
+        Uses its own session because the request-scoped one from get_db
+        is closed before the response body is sent.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["ID", "Timestamp", "Severity", "Source", "Message"])
+        yield buffer.getvalue()
+        
+        async with AsyncSessionFactory() as session:
+            result = await session.stream_scalars(query)
+            async for log in result:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow([
+                    log.id,
+                    log.timestamp.isoformat(),
+                    log.severity,
+                    log.source,
+                    log.message
+                ])
+                yield buffer.getvalue()
     
     return StreamingResponse(
-        iter([output.getvalue()]),
+        row_iter(),
         media_type="text/csv",
         headers={
-            "Content-Disposition": f"attachment; filename=logs_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+            "Content-Disposition": f"attachment; filename=logs_export_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
         }
     )
 
@@ -357,7 +544,9 @@ async def get_log(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific log entry by ID."""
-    result = await db.execute(select(Log).where(Log.id == log_id))
+    # The statement is built and compiled once; log_id is tracked as a
+    # bound parameter of the lambda
+    result = await db.execute(lambda_stmt(lambda: select(Log).where(Log.id == log_id)))
     log = result.scalars().first()
     
     if not log:
@@ -376,8 +565,20 @@ async def update_log(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing log entry."""
-    result = await db.execute(select(Log).where(Log.id == log_id))
-    log = result.scalars().first()
+    # Update only provided fields
+    update_data = log_data.model_dump(mode="json", exclude_unset=True)
+    if update_data:
+        stmt = (
+            update(Log)
+            .where(Log.id == log_id)
+            .values(**update_data)
+            .returning(Log)
+        )
+    else:
+        stmt = select(Log).where(Log.id == log_id)
+    
+    result = await db.execute(stmt)
+    log = result.scalar_one_or_none()
     
     if not log:
         raise HTTPException(
@@ -385,13 +586,8 @@ async def update_log(
             detail=f"Log with id {log_id} not found"
         )
     
-    # Update only provided fields
-    update_data = log_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(log, field, value)
-    
-    await db.flush()
-    await db.refresh(log)
+    await db.commit()
+    invalidate_sources_cache({log.source})
     return log
 
 
@@ -401,15 +597,15 @@ async def delete_log(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a log entry."""
-    result = await db.execute(select(Log).where(Log.id == log_id))
-    log = result.scalars().first()
+    result = await db.execute(
+        delete(Log).where(Log.id == log_id).returning(Log.id)
+    )
     
-    if not log:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Log with id {log_id} not found"
         )
     
-    await db.delete(log)
     return None
 
@@ -4,6 +4,8 @@ from app.schemas.log import (
     LogUpdate,
     LogResponse,
     LogListResponse,
+    LogListAdapter,
+    LogCursor,
     LogAggregation,
     LogTrend,
     LogStats,
@@ -15,6 +17,8 @@ __all__ = [
     "LogUpdate", 
     "LogResponse",
     "LogListResponse",
+    "LogListAdapter",
+    "LogCursor",
     "LogAggregation",
     "LogTrend",
     "LogStats",
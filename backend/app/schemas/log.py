@@ -1,7 +1,7 @@
 """Pydantic schemas for Log operations."""
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 
 from app.models.log import LogSeverity
 
@@ -18,6 +18,14 @@ class LogCreate(LogBase):
     """Schema for creating a new log entry."""
     timestamp: Optional[datetime] = None  # If not provided, uses server time
 
+    @field_validator("timestamp")
+    @classmethod
+    def assume_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Treat timestamps without a timezone as UTC."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+
 
 class LogUpdate(BaseModel):
     """Schema for updating an existing log entry."""
@@ -37,13 +45,25 @@ class LogResponse(LogBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Validates a whole page of ORM logs in a single call
+LogListAdapter = TypeAdapter(list[LogResponse])
+
+
+class LogCursor(BaseModel):
+    """Schema for a keyset pagination cursor (last log of a page)."""
+    ts: datetime
+    id: int
+
+
 class LogListResponse(BaseModel):
     """Schema for paginated log list response."""
     items: list[LogResponse]
-    total: int
+    total: Optional[int]  # None on cursor pages
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    is_estimated: bool = False  # True when total comes from the planner estimate
+    next_cursor: Optional[LogCursor] = None  # Pass as cursor_ts/cursor_id for the next page
 
 
 class LogFilter(BaseModel):
@@ -0,0 +1,100 @@
+"""Background tasks run for the lifetime of the application."""
+import asyncio
+import logging
+
+from sqlalchemy import insert
+
+from app.cache import invalidate_sources_cache
+from app.config import settings
+from app.database import AsyncSessionFactory, engine
+from app.models.log import Log, ensure_log_partitions
+from app.models.stats import REFRESH_STATS_VIEW
+
+logger = logging.getLogger(__name__)
+
+# Log rows accepted by POST /logs/bulk-async, waiting to be written
+LOG_QUEUE: asyncio.Queue[dict] = asyncio.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE)
+
+
+async def refresh_stats_view():
+    """Refresh the daily log statistics materialized view."""
+    async with AsyncSessionFactory() as session:
+        await session.execute(REFRESH_STATS_VIEW)
+        await session.commit()
+
+
+async def stats_refresher():
+    """Periodically refresh the statistics view until cancelled."""
+    while True:
+        await asyncio.sleep(settings.STATS_REFRESH_INTERVAL_SECONDS)
+        try:
+            await refresh_stats_view()
+        except Exception:
+            logger.exception("Failed to refresh mv_daily_log_stats")
+
+
+async def write_log_batch(batch: list[dict]):
+    """Insert a batch of queued log rows in a single multi-row INSERT."""
+    if not batch:
+        return
+    try:
+        async with AsyncSessionFactory() as session:
+            await session.execute(insert(Log), batch)
+            await session.commit()
+        # Only now can GET /logs/sources see the new rows
+        invalidate_sources_cache({row["source"] for row in batch})
+    except Exception:
+        logger.exception("Failed to write %d queued logs", len(batch))
+
+
+async def log_flusher():
+    """
+    Write queued logs in batches until cancelled.
+    
+    A batch is flushed once it reaches LOG_FLUSH_BATCH_SIZE rows or
+    LOG_FLUSH_INTERVAL_SECONDS after its first row arrived, whichever
+    comes first.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await LOG_QUEUE.get()]
+        deadline = loop.time() + settings.LOG_FLUSH_INTERVAL_SECONDS
+        try:
+            while len(batch) < settings.LOG_FLUSH_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(LOG_QUEUE.get(), timeout))
+                except TimeoutError:
+                    break
+        finally:
+            # Also runs on cancellation so a partially collected batch is kept.
+            # The write is shielded: a cancel arriving mid-INSERT would roll
+            # it back, and these rows are already off the queue.
+            write = asyncio.create_task(write_log_batch(batch))
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                await write
+                raise
+
+
+async def drain_log_queue():
+    """Write every log still waiting in the queue (used on shutdown)."""
+    while not LOG_QUEUE.empty():
+        batch = []
+        while not LOG_QUEUE.empty() and len(batch) < settings.LOG_FLUSH_BATCH_SIZE:
+            batch.append(LOG_QUEUE.get_nowait())
+        await write_log_batch(batch)
+
+
+async def partition_maintainer():
+    """Create upcoming monthly logs partitions once a day until cancelled."""
+    while True:
+        await asyncio.sleep(24 * 60 * 60)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(ensure_log_partitions)
+        except Exception:
+            logger.exception("Failed to create logs partitions")
@@ -7,15 +7,16 @@ Usage:
 """
 import asyncio
 import random
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.database import engine, Base, AsyncSessionFactory
-from app.models.log import Log, LogSeverity
+from app.database import engine, Base
+from app.models.log import LogSeverity
+from app.tasks import refresh_stats_view
 
 
 # Sample data for realistic logs
@@ -119,49 +120,52 @@ async def seed_logs(num_logs: int = 500, days_back: int = 30):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    async with AsyncSessionFactory() as session:
-        print(f"Creating {num_logs} sample log entries...")
-        
-        logs = []
-        now = datetime.utcnow()
-        
-        for i in range(num_logs):
-            # Random timestamp within the date range
-            random_days = random.uniform(0, days_back)
-            random_hours = random.uniform(0, 24)
-            timestamp = now - timedelta(days=random_days, hours=random_hours)
-            
-            severity = random_severity()
-            source = random.choice(SOURCES)
-            message = generate_message(severity)
-            
-            log = Log(
-                timestamp=timestamp,
-                message=message,
-                severity=severity,
-                source=source
-            )
-            logs.append(log)
-            
-            if (i + 1) % 100 == 0:
-                print(f"  Created {i + 1}/{num_logs} logs...")
-        
-        session.add_all(logs)
-        await session.commit()
+    print(f"Creating {num_logs} sample log entries...")
+    
+    records = []
+    now = datetime.now(UTC)
+    
+    for i in range(num_logs):
+        # Random timestamp within the date range
+        random_days = random.uniform(0, days_back)
+        random_hours = random.uniform(0, 24)
+        timestamp = now - timedelta(days=random_days, hours=random_hours)
         
-        print(f"\n✅ Successfully created {num_logs} log entries!")
-        print(f"   Date range: {(now - timedelta(days=days_back)).date()} to {now.date()}")
-        print(f"   Sources: {len(SOURCES)}")
-        print("\nSeverity distribution:")
+        severity = random_severity()
+        source = random.choice(SOURCES)
+        message = generate_message(severity)
         
-        # Count by severity
-        severity_counts = {}
-        for log in logs:
-            severity_counts[log.severity] = severity_counts.get(log.severity, 0) + 1
+        records.append((timestamp, message, severity.value, source))
         
-        for sev, count in sorted(severity_counts.items(), key=lambda x: x[1], reverse=True):
-            pct = (count / num_logs) * 100
-            print(f"   {sev.value}: {count} ({pct:.1f}%)")
+        if (i + 1) % 100 == 0:
+            print(f"  Created {i + 1}/{num_logs} logs...")
+    
+    # COPY FROM STDIN bypasses per-row SQL parsing and is much faster than
+    # INSERT for large seeds, so it goes straight through asyncpg
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "logs",
+            records=records,
+            columns=["timestamp", "message", "severity", "source"]
+        )
+    
+    # Make the new logs visible to the dashboard statistics
+    await refresh_stats_view()
+    
+    print(f"\n✅ Successfully created {num_logs} log entries!")
+    print(f"   Date range: {(now - timedelta(days=days_back)).date()} to {now.date()}")
+    print(f"   Sources: {len(SOURCES)}")
+    print("\nSeverity distribution:")
+    
+    # Count by severity
+    severity_counts = {}
+    for _, _, sev, _ in records:
+        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    
+    for sev, count in sorted(severity_counts.items(), key=lambda x: x[1], reverse=True):
+        pct = (count / num_logs) * 100
+        print(f"   {sev}: {count} ({pct:.1f}%)")
 
 
 async def main():
@@ -52,8 +52,8 @@ export default function LogsListPage() {
       });
       
       setLogs(response.items);
-      setTotalPages(response.total_pages);
-      setTotal(response.total);
+      setTotalPages(response.total_pages ?? 1);
+      setTotal(response.total ?? 0);
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to fetch logs");
     } finally {
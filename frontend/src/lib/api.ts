@@ -24,10 +24,17 @@ export interface Log {
 
 export interface LogListResponse {
   items: Log[];
-  total: number;
+  total: number | null;  // null on cursor pages
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
+  is_estimated: boolean;
+  next_cursor?: LogCursor | null;
+}
+
+export interface LogCursor {
+  ts: string;
+  id: number;
 }
 
 export interface LogAggregation {
@@ -62,6 +69,8 @@ export interface LogFilter {
   search?: string;
   sort_by?: string;
   sort_order?: 'asc' | 'desc';
+  cursor_ts?: string;
+  cursor_id?: number;
 }
 
 export interface CreateLogData {